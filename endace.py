@@ -16,12 +16,20 @@
 
 import json
 import vectra_official as vectra
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional
-from itertools import product
+from urllib.parse import quote, urlencode
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from requests.packages.urllib3.util.retry import Retry
+try:
+    # orjson parses the detection pages noticeably faster than the standard library, use it when available
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 __author__ = "Aurélien Hess"
@@ -40,6 +48,45 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 VECTRA_APPLIANCE_URL = 'https://<BRAIN_FQDN>'
 API_TOKEN = 'youneedanapikeyforthistowork'
 ENDACE_URL = 'https://endace.example.com'
+# Marker identifying the enrichment note among the notes of a detection
+ENDACE_NOTE_MARK = 'Endace'
+# Number of concurrent API calls against the brain, keep it below the session pool size
+MAX_WORKERS = 20
+
+
+def build_session() -> requests.Session:
+    """
+    Build the requests.Session shared by all API calls
+    Connections are pooled and kept alive, so successive calls to the brain reuse the same TCP/TLS connection
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    # Transient errors are retried on the pooled connection instead of failing the whole run.
+    # POST is left out as creating a note is not idempotent. Once retries are exhausted the last
+    # response is returned so the API error is still reported through HTTPException
+    retries = Retry(
+        total=5,
+        backoff_factor=0.25,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'PATCH', 'PUT']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.verify = False
+    return session
+
+
+SESSION = build_session()
+
+
+# Where to find the error message in an API error body, in order of precedence
+ERROR_DETAIL_EXTRACTORS = (
+    ('detail', lambda r: r['detail']),
+    ('errors', lambda r: r['errors'][0]['title']),
+    ('_meta', lambda r: r['_meta']['message']),
+)
 
 
 class HTTPException(Exception):
@@ -49,29 +96,36 @@ class HTTPException(Exception):
         The body is contructed by extracting the API error code from the requests.Response object
         """
         try: 
-            r = response.json()
-            if 'detail' in r:
-                detail = r['detail']
-            elif 'errors' in r:
-                detail = r['errors'][0]['title']
-            elif '_meta' in r:
-                detail = r['_meta']['message']
-            else:
-                detail = response.content
+            r = json_loads(response.content)
+            detail = next((extract(r) for key, extract in ERROR_DETAIL_EXTRACTORS if key in r), response.content)
         except Exception: 
             detail = response.content
         body = 'Status code: {code} - {detail}'.format(code=str(response.status_code), detail=detail)
         super().__init__(body)
 
 
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a Vectra API timestamp (YYYY-MM-DDTHH:MM:SSZ) into a UTC aware datetime
+    The format is fixed, so slicing is much cheaper than datetime.strptime
+    :param timestamp: timestamp string
+    :rtype: datetime
+    """
+    return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                    int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]), tzinfo=timezone.utc)
+
+
 class VectraDetection:
 
     def __init__(self, detection):
         self.id:int = int(detection['id'])
         self.src:str = detection['src_ip']
-        self.destinations:list = self._get_destinations(detection)
-        self.first_timestamp:str = datetime.strptime(detection['first_timestamp'], "%Y-%m-%dT%H:%M:%SZ")
-        self.last_timestamp:str = datetime.strptime(detection['last_timestamp'], "%Y-%m-%dT%H:%M:%SZ")
+        self.destinations:tuple = self._get_destinations(detection)
+        self.first_timestamp:datetime = parse_timestamp(detection['first_timestamp'])
+        self.last_timestamp:datetime = parse_timestamp(detection['last_timestamp'])
+        # Epoch milliseconds, as used in the Endace links
+        self.first_ms:int = int(self.first_timestamp.timestamp()*1000)
+        self.last_ms:int = int(self.last_timestamp.timestamp()*1000)
         self.note_id:Optional[int] = None
 
     def _get_destinations(self, detection):
@@ -79,7 +133,7 @@ class VectraDetection:
         for details in detection['grouped_details']:
             dest_ips = details.get('dst_ips', [])
             destinations.update(dest_ips)
-        return list(destinations)
+        return tuple(destinations)
 
 
 DetectionDict = Dict[int, VectraDetection] 
@@ -92,36 +146,56 @@ class VectraAPIWrapper(vectra.VectraClientV2_2):
         """
         Function that returns dict of all keys present in dict1 and NOT in dict 2
         """
-        result_dict = {}
-        for key, value in dict1.items():
-            if key not in dict2.keys():
-                result_dict[key] = value
-        return result_dict
+        return {key: dict1[key] for key in dict1.keys() - dict2.keys()}
 
-    def __init__(self, url=None, token=None, verify=False):
+    def __init__(self, url=None, token=None, verify=False, session=SESSION):
         """
         Initialize Vectra client
         :param url: IP or hostname of Vectra brain - required
         :param token: API token for authentication - required
         :param verify: verify SSL - optional
+        :param session: shared requests.Session with connection pooling - optional
         """
-        vectra.VectraClientV2_2.__init__(self, url=url, token=token, verify=verify)
+        vectra.VectraClientV2_2.__init__(self, url=url, token=token, verify=verify, session=session)
         self.logger = logging.getLogger('VectraClient')
+        # Tagged detections per tag, shared by get_all_detections_to_enrich and get_all_detections_to_update
+        self._tagged_detections_cache: Dict[str, DetectionDict] = {}
+
+    def _iter_detections(self, **kwargs):
+        """
+        Generator over the raw detections of all pages matching the query
+        Unlike get_all_detections, each page is parsed only once
+        :param kwargs: detection query parameters, see get_all_detections
+        :rtype: Iterator[dict]
+        """
+        url = '{url}/detections'.format(url=self.url)
+        params = self._generate_detection_params(kwargs)
+        while url:
+            page = self.session.get(url, headers=self.headers, params=params, verify=self.verify)
+            if page.status_code not in [200, 201, 204]:
+                raise HTTPException(page)
+            body = json_loads(page.content)
+            yield from body.get('results', [])
+            # The next page URL already carries the query parameters
+            url = body.get('next')
+            params = None
 
-    def _get_tagged_detections(self, tag: str) -> DetectionDict:
+    def _get_tagged_detections(self, tag: str, refresh: bool = False) -> DetectionDict:
         """
         Get a dictionnary of all detections that contain given tag
+        The result is cached per tag for the lifetime of the client
         :param tag: tag to search
+        :param refresh: query the API again even if the tag is cached - optional
         :rtype: DetectionDict
         """
+        if not refresh and tag in self._tagged_detections_cache:
+            return self._tagged_detections_cache[tag]
         detections = {}
-        r = self.get_all_detections(tags=tag)
-        for page in r:
-            if page.status_code not in [200, 201, 204]:
-                raise HTTPException(page)
-            for detection in page.json().get('results', []):
-                if tag in detection['tags']: # for some reason the API does substring matching, so we check
-                    detections[detection['id']] = VectraDetection(detection)
+        for detection in self._iter_detections(tags=tag):
+            # for some reason the API does substring matching, so we check for an exact tag
+            if tag in (detection.get('tags') or ()):
+                detections[detection['id']] = VectraDetection(detection)
+        self._tagged_detections_cache[tag] = detections
         return detections
 
     def _get_active_detections(self) -> DetectionDict:
@@ -130,12 +204,8 @@ class VectraAPIWrapper(vectra.VectraClientV2_2):
         :rtype: DetectionDict
         """
         detections = {}
-        r = self.get_all_detections(state='active')
-        for page in r:
-            if page.status_code not in [200, 201, 204]:
-                raise HTTPException(page)
-            for detection in page.json().get('results', []):
-                detections[detection['id']] = VectraDetection(detection)
+        for detection in self._iter_detections(state='active'):
+            detections[detection['id']] = VectraDetection(detection)
         return detections
 
     def _get_endace_note(self, detection_id) -> json:
@@ -145,9 +215,7 @@ class VectraAPIWrapper(vectra.VectraClientV2_2):
         :rtype: Optional int
         """
         r = self.get_detection_note(detection_id=detection_id)
-        for note in r.json():
-            if "Endace" in note['note']:
-                return note
+        return next((note for note in json_loads(r.content) if ENDACE_NOTE_MARK in note['note']), None)
 
     def get_all_detections_to_enrich(self) -> DetectionDict:
         active_detections = self._get_active_detections()
@@ -157,10 +225,14 @@ class VectraAPIWrapper(vectra.VectraClientV2_2):
     def get_all_detections_to_update(self) -> DetectionDict:
         detections = {}
         already_tagged_detections = self._get_tagged_detections(tag='Endace')
+        # Fetch the notes of all tagged detections concurrently, each fetch is an independent API call
+        ids = list(already_tagged_detections.keys())
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            notes = dict(zip(ids, executor.map(self._get_endace_note, ids)))
         for detection_id, detection in already_tagged_detections.items():
-            note = self._get_endace_note(detection_id)
+            note = notes[detection_id]
             last_modified = note['date_modified'] if note.get('date_modified') else note['date_created']
-            note_last_timestamp = datetime.strptime(last_modified, "%Y-%m-%dT%H:%M:%SZ")
+            note_last_timestamp = parse_timestamp(last_modified)
             # Only update if detection was updated more recently than note
             if detection.last_timestamp > note_last_timestamp: 
                 detection.note_id=note['id']
@@ -176,44 +248,61 @@ class EndaceClient(object):
         :param url: base URL of Endace instance - required
         """
         self.url = url
+        self.pivot_url = '{url}/vision2/v1/pivotintovision/?'.format(url=url)
         self.logger = logging.getLogger('EndaceClient')
 
     def generate_endace_link(self, vectra_detection)-> str: 
         source_ip = vectra_detection.src
         title = "Vectra{id}".format(id=str(vectra_detection.id))
         destination_ips = vectra_detection.destinations
-        # Make the timestamps tz aware (UTC) and convert to milliseconds
-        start_ts = int(vectra_detection.first_timestamp.replace(tzinfo=timezone.utc).timestamp()*1000)
-        end_ts = int(vectra_detection.last_timestamp.replace(tzinfo=timezone.utc).timestamp()*1000)
-        delta_time = end_ts - start_ts
-        # If delta time is more than 1 hour, make start time 1 hour before end time
-        if delta_time > 3600000:
-            start_ts = end_ts - 3600000
         # Add 4 minutes to end time to pick up any event right after this update
-        end_ts = end_ts + 240000
-        # Add 2 minutes before to start time to avoid a single sample to be all to the left
-        start_ts = start_ts - 120000
-        # If we have <5 destinations, filter by destination, else only src
-        if len (destination_ips) > 5 or len (destination_ips)<1:
-            link = "{url}/vision2/v1/pivotintovision/?datasources=tag%3Aall&title={title}&start={start}&end={end}&ip={src}&tools=trafficOverTime_by_app%2Cconversations_by_ipaddress".format(
-                    url = self.url,
-                    title = title,
-                    start = str(start_ts),
-                    end = str(end_ts),
-                    src = source_ip
-                )
+        end_ts = vectra_detection.last_ms + 240000
+        # Start at most 1 hour before the last timestamp, and add 2 minutes before to avoid a single sample
+        # to be all to the left
+        start_ts = max(vectra_detection.first_ms, vectra_detection.last_ms - 3600000) - 120000
+        params = {'datasources': 'tag:all', 'title': title, 'start': start_ts, 'end': end_ts}
+        # If we have 1 to 5 destinations, filter by destination, else only src
+        if not 1 <= len(destination_ips) <= 5:
+            params['ip'] = source_ip
         else:
-            separator = ',' + source_ip + '%26'
-            src_dst_ips_pair = separator.join(destination_ips)
-            ip_conversation_string = source_ip + '%26' + src_dst_ips_pair
-            link = "{url}/vision2/v1/pivotintovision/?datasources=tag%3Aall&title={title}&start={start}&end={end}&ip_conv={ip_conversations}&tools=trafficOverTime_by_app%2Cconversations_by_ipaddress".format(
-                    url = self.url,
-                    title = title,
-                    start = str(start_ts),
-                    end = str(end_ts),
-                    ip_conversations = ip_conversation_string
-                )
-        return link
+            params['ip_conv'] = ','.join('{src}&{dst}'.format(src=source_ip, dst=dst) for dst in destination_ips)
+        params['tools'] = 'trafficOverTime_by_app,conversations_by_ipaddress'
+        return self.pivot_url + urlencode(params, quote_via=quote, safe='')
+
+def enrich_detection(vac, ec, detection) -> int:
+    """
+    Create the Endace note on a detection
+    :param vac: VectraAPIWrapper
+    :param ec: EndaceClient
+    :param detection: VectraDetection
+    :rtype: int detection ID
+    """
+    logger = logging.getLogger()
+    link = ec.generate_endace_link(detection)
+    note = "Endace link: [click here]({})".format(link)
+    vac.set_detection_note(detection.id, note)
+    logger.info('Added Endace note/link to detection ID {}'.format(str(detection.id)))
+    logger.debug('Link is: {}'.format(link))
+    return detection.id
+
+
+def update_detection(vac, ec, detection) -> int:
+    """
+    Update the existing Endace note of a detection
+    :param vac: VectraAPIWrapper
+    :param ec: EndaceClient
+    :param detection: VectraDetection with note_id set
+    :rtype: int detection ID
+    """
+    logger = logging.getLogger()
+    logger.info('Detection to update: {}'.format(detection.id))
+    link = ec.generate_endace_link(detection)
+    note = "Endace link: [click here]({})".format(link)
+    vac.update_detection_note(detection_id=detection.id, note_id=detection.note_id, note=note)
+    logger.info('Updated Endace note/link to detection ID {}'.format(str(detection.id)))
+    logger.debug('Link is: {}'.format(link))
+    return detection.id
+
 
 if __name__ == "__main__":
     logger = logging.getLogger()
@@ -222,25 +311,21 @@ if __name__ == "__main__":
     detections_to_enrich = vac.get_all_detections_to_enrich()
     detections_to_update = vac.get_all_detections_to_update()
 
-    for detection_id, detection in detections_to_enrich.items():
-        link = ec.generate_endace_link(detection)
-        note = "Endace link: [click here]({})".format(link)
-        # Create the note
-        vac.set_detection_note(detection_id, note)
-        logger.info('Added Endace note/link to detection ID {}'.format(str(detection_id)))
-        logger.debug('Link is: {}'.format(link))
-        # Set tag for tracking
-        vac.set_detection_tags(detection_id=detection_id, tags=['Endace'], append=True)
-        logger.debug('Added Endace tag to detection ID {}'.format(str(detection_id)))
-    
-    for detection_id, detection in detections_to_update.items():
-        logger.info('Detection to update: {}'.format(detection_id))
-        link = ec.generate_endace_link(detection)
-        note = "Endace link: [click here]({})".format(link)
-        # Update the note
-        vac.update_detection_note(detection_id=detection_id, note_id=detection.note_id, note=note)
-        logger.info('Updated Endace note/link to detection ID {}'.format(str(detection_id)))
-        logger.debug('Link is: {}'.format(link))
-
-
-
+    enriched_detection_ids = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(enrich_detection, vac, ec, d) for d in detections_to_enrich.values()]
+        futures += [executor.submit(update_detection, vac, ec, d) for d in detections_to_update.values()]
+        enrich_futures = set(futures[:len(detections_to_enrich)])
+        for future in as_completed(futures):
+            try:
+                detection_id = future.result()
+            except Exception as e:
+                logger.error('Failed to write Endace note: {}'.format(str(e)))
+                continue
+            if future in enrich_futures:
+                enriched_detection_ids.append(detection_id)
+
+    # Set tag for tracking, in a single bulk call for all detections that received a note
+    if enriched_detection_ids:
+        vac.bulk_set_detections_tag('Endace', enriched_detection_ids)
+        logger.debug('Added Endace tag to detection IDs {}'.format(str(enriched_detection_ids)))
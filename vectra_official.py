@@ -64,7 +64,7 @@ def param_deprecation(key):
 
 class VectraClient(object):
 
-    def __init__(self, url=None, token=None, user=None, password=None, verify=False):
+    def __init__(self, url=None, token=None, user=None, password=None, verify=False, session=None):
         """
         Initialize Vectra client
         :param url: IP or hostname of Vectra brain (ex https://www.example.com) - required
@@ -72,11 +72,13 @@ class VectraClient(object):
         :param user: Username to authenticate to Vectra brain when using API v1*
         :param password: Password when using username to authenticate using API v1*
         :param verify: Verify SSL (default: False) - optional
+        :param session: requests.Session used for all API calls, allows connection reuse (default: new session) - optional
         *Either token or user are required
         """
         self.url = url
         self.version = 2 if token else 1
         self.verify = verify
+        self.session = session if session is not None else requests.Session()
 
         url = VectraClient._remove_trailing_slashes(url)
 
@@ -304,9 +306,9 @@ class VectraClient(object):
         for k, v in kwargs.items():
             params[k] = v
         if self.version == 2:
-            return requests.get(url, headers=self.headers, params=params, verify=self.verify)
+            return self.session.get(url, headers=self.headers, params=params, verify=self.verify)
         else:
-            return requests.get(url, auth=self.auth, params=params, verify=self.verify)
+            return self.session.get(url, auth=self.auth, params=params, verify=self.verify)
 
     @validate_api_v2
     @request_error_handler
@@ -325,7 +327,7 @@ class VectraClient(object):
         :param page: page number to return (int)
         :param page_size: number of object to return in repsonse (int)
         """
-        return requests.get('{url}/campaigns'.format(url=self.url), headers=self.headers,
+        return self.session.get('{url}/campaigns'.format(url=self.url), headers=self.headers,
                                 params=self._generate_campaign_params(kwargs), verify=self.verify)
     
     def get_all_campaigns(self, **kwargs):
@@ -343,7 +345,7 @@ class VectraClient(object):
         :param page: page number to return (int)
         :param page_size: number of object to return in repsonse (int)
         """
-        resp = requests.get('{url}/campaigns'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/campaigns'.format(url=self.url), headers=self.headers,
                                 params=self._generate_campaign_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -359,7 +361,7 @@ class VectraClient(object):
         if not campaign_id:
             raise ValueError('Campaign id required')
 
-        return requests.get('{url}/campaigns/{id}'.format(url=self.url, id=campaign_id),
+        return self.session.get('{url}/campaigns/{id}'.format(url=self.url, id=campaign_id),
             headers=self.headers, verify=self.verify)
 
     @request_error_handler
@@ -407,10 +409,10 @@ class VectraClient(object):
         """
 
         if self.version == 2:
-            return requests.get('{url}/hosts'.format(url=self.url), headers=self.headers,
+            return self.session.get('{url}/hosts'.format(url=self.url), headers=self.headers,
                                 params=self._generate_host_params(kwargs), verify=self.verify)
         else:
-            return requests.get('{url}/hosts'.format(url=self.url), auth=self.auth,
+            return self.session.get('{url}/hosts'.format(url=self.url), auth=self.auth,
                                 params=self._generate_host_params(kwargs), verify=self.verify)
 
     def get_all_hosts(self, **kwargs):
@@ -455,7 +457,7 @@ class VectraClient(object):
         :param threat: threat score (int)
         :param threat_gte: threat score greater than or equal to (int)
         """
-        resp = requests.get('{url}/hosts'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/hosts'.format(url=self.url), headers=self.headers,
                                 params=self._generate_host_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -483,10 +485,10 @@ class VectraClient(object):
             raise ValueError('Host id required')
 
         if self.version == 2:
-            return requests.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers,
+            return self.session.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers,
                                 params=self._generate_host_by_id_params(kwargs), verify=self.verify)
         else:
-            return requests.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), auth=self.auth,
+            return self.session.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), auth=self.auth,
                                 params=self._generate_host_by_id_params(kwargs), verify=self.verify)
 
     @validate_api_v2
@@ -506,7 +508,7 @@ class VectraClient(object):
         else:
             payload = {'key_asset':'false'}
 
-        return requests.patch('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, json=payload,
+        return self.session.patch('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, json=payload,
                               verify=self.verify)
 
     @validate_api_v2
@@ -519,7 +521,7 @@ class VectraClient(object):
         if not host_id:
             raise ValueError('Host id required')
 
-        return requests.get('{url}/tagging/host/{id}'.format(url=self.url, id=host_id), headers=self.headers,
+        return self.session.get('{url}/tagging/host/{id}'.format(url=self.url, id=host_id), headers=self.headers,
                             verify=False)
 
     @validate_api_v2
@@ -547,7 +549,7 @@ class VectraClient(object):
         else:
             raise TypeError('tags must be of type list')
 
-        return requests.patch('{url}/tagging/host/{id}'.format(url=self.url, id=host_id), headers=self.headers,
+        return self.session.patch('{url}/tagging/host/{id}'.format(url=self.url, id=host_id), headers=self.headers,
                               json=payload, verify=self.verify)
 
     @validate_api_v2
@@ -564,7 +566,7 @@ class VectraClient(object):
             'objectIds': host_ids,
             'tag': tag
         }
-        return requests.post('{url}/tagging/host'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/tagging/host'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @validate_api_v2
@@ -581,7 +583,7 @@ class VectraClient(object):
             'objectIds': host_ids,
             'tag': tag
         }
-        return requests.delete('{url}/tagging/host'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.delete('{url}/tagging/host'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @validate_api_v2
@@ -597,7 +599,7 @@ class VectraClient(object):
         if not host_id:
             raise ValueError('Host id required')
 
-        host = requests.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, verify=self.verify)
+        host = self.session.get('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, verify=self.verify)
         if host.status_code == 200:
             host_note = host.json()['note']
             # API endpoint return HTML escaped characters
@@ -641,7 +643,7 @@ class VectraClient(object):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.patch('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, data=json.dumps(payload),
+        return self.session.patch('{url}/hosts/{id}'.format(url=self.url, id=host_id), headers=self.headers, data=json.dumps(payload),
                                       verify=self.verify)
 
     @request_error_handler
@@ -685,10 +687,10 @@ class VectraClient(object):
         """
 
         if self.version == 2:
-            return requests.get('{url}/detections'.format(url=self.url), headers=self.headers,
+            return self.session.get('{url}/detections'.format(url=self.url), headers=self.headers,
                                 params=self._generate_detection_params(kwargs), verify=self.verify)
         else:
-            return requests.get('{url}/detections'.format(url=self.url), auth=self.auth,
+            return self.session.get('{url}/detections'.format(url=self.url), auth=self.auth,
                                 params=self._generate_detection_params(kwargs), verify=self.verify)
 
     def get_all_detections(self, **kwargs):
@@ -729,7 +731,7 @@ class VectraClient(object):
         :param threat_gte threat score is greater than or equal to (int)
         :param note_modified_timestamp_gte: note last modified timestamp greater than or equal to (datetime)
         """
-        resp = requests.get('{url}/detections'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/detections'.format(url=self.url), headers=self.headers,
                                 params=self._generate_detection_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -753,10 +755,10 @@ class VectraClient(object):
             raise ValueError('Detection id required')
 
         if self.version == 2:
-            return requests.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
+            return self.session.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
                                 params=self._generate_detection_params(kwargs), verify=self.verify)
         else:
-            return requests.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), auth=self.auth,
+            return self.session.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), auth=self.auth,
                                 params=self._generate_detection_params(kwargs), verify=self.verify)
 
     @validate_api_v2
@@ -790,7 +792,7 @@ class VectraClient(object):
             'mark_as_fixed': str(fixed)
             }
 
-        return requests.patch('{url}/detections'.format(url=self.url), json=payload, headers=self.headers,
+        return self.session.patch('{url}/detections'.format(url=self.url), json=payload, headers=self.headers,
                              verify=self.verify)
 
     @validate_api_v2
@@ -810,7 +812,7 @@ class VectraClient(object):
             "detectionIdList": detection_ids
         }
 
-        return requests.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
                              verify=self.verify)
 
     @validate_api_v2
@@ -828,7 +830,7 @@ class VectraClient(object):
             "detectionIdList": detection_ids
         }
 
-        response = requests.delete('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
+        response = self.session.delete('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
                              verify=self.verify)
 
         # DELETE returns an empty response, but we populate the response for consistency with the mark_as_fixed() function
@@ -844,7 +846,7 @@ class VectraClient(object):
         Get detection tags
         :param detection_id:
         """
-        return requests.get('{url}/tagging/detection/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
+        return self.session.get('{url}/tagging/detection/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
                             verify=False)
 
     @validate_api_v2
@@ -869,7 +871,7 @@ class VectraClient(object):
         else:
             raise TypeError('tags must be of type list')
 
-        return requests.patch('{url}/tagging/detection/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
+        return self.session.patch('{url}/tagging/detection/{id}'.format(url=self.url, id=detection_id), headers=self.headers,
                               json=payload, verify=self.verify)
 
     @validate_api_v2
@@ -886,7 +888,7 @@ class VectraClient(object):
             'objectIds': detection_ids,
             'tag': tag
         }
-        return requests.post('{url}/tagging/detection'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/tagging/detection'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @validate_api_v2
@@ -903,7 +905,7 @@ class VectraClient(object):
             'objectIds': detection_ids,
             'tag': tag
         }
-        return requests.delete('{url}/tagging/detection'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.delete('{url}/tagging/detection'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @validate_api_v2
@@ -915,7 +917,7 @@ class VectraClient(object):
         For consistency we return a requests.models.Response object
         As we do not want to return the complete detection body, we alter the response content
         """
-        detection = requests.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers, verify=self.verify)
+        detection = self.session.get('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers, verify=self.verify)
         if detection.status_code == 200:
             detection_note = detection.json()['note']
             # API endpoint return HTML escaped characters
@@ -956,7 +958,7 @@ class VectraClient(object):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.patch('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers, json=payload,
+        return self.session.patch('{url}/detections/{id}'.format(url=self.url, id=detection_id), headers=self.headers, json=payload,
             verify=self.verify)
 
     @validate_api_v2
@@ -966,7 +968,7 @@ class VectraClient(object):
         :param detection_id: ID of the detection for which to get a pcap
         :param filename: filename to write the pcap to. Will be overwriten if already exists.
         """
-        response = requests.get('{url}/detections/{id}/pcap'.format(url=self.url, id=detection_id), headers=self.headers,
+        response = self.session.get('{url}/detections/{id}/pcap'.format(url=self.url, id=detection_id), headers=self.headers,
                             verify=False)
         if response.status_code not in [200, 201, 204]:
             raise HTTPException(response)
@@ -1007,7 +1009,7 @@ class VectraClient(object):
             deprecation('The "rule_id" argument will be removed from this function, please use the corresponding get_rule_by_id function')
             return self.get_rule_by_id(rule_id)
         else:
-            return requests.get('{url}/rules'.format(url=self.url), headers=self.headers,
+            return self.session.get('{url}/rules'.format(url=self.url), headers=self.headers,
                                 params=self._generate_rule_params(kwargs), verify=self.verify)
 
     @validate_api_v2
@@ -1029,7 +1031,7 @@ class VectraClient(object):
 
         deprecation('Some rules are no longer compatible with the APIv2, please switch to the APIv2.1')
 
-        return requests.get('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers,
+        return self.session.get('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers,
                                 params=self._generate_rule_by_id_params(kwargs), verify=False)
 
     # TODO make return type requests.Reponse
@@ -1063,7 +1065,7 @@ class VectraClient(object):
         :param page: page number to return (int)
         :param page_size: number of object to return in repsonse (int)
         """
-        resp = requests.get('{url}/rules'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/rules'.format(url=self.url), headers=self.headers,
                                 params=self._generate_rule_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1138,7 +1140,7 @@ class VectraClient(object):
             else:
                 raise ValueError('argument {} is an invalid field for rule creation'.format(str(k)))
 
-        return requests.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
                              verify=self.verify)
 
     @validate_api_v2
@@ -1217,7 +1219,7 @@ class VectraClient(object):
             else:
                 raise ValueError('invalid parameter provided: {}'.format(str(k)))
 
-        return requests.put('{url}/rules/{id}'.format(url=self.url, id=rule['id']), headers=self.headers, json=rule,
+        return self.session.put('{url}/rules/{id}'.format(url=self.url, id=rule['id']), headers=self.headers, json=rule,
                             verify=self.verify)
 
     @validate_api_v2
@@ -1237,7 +1239,7 @@ class VectraClient(object):
             'restore_detections': restore_detections
         }
 
-        return requests.delete('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers, params=params,
+        return self.session.delete('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers, params=params,
                                verify=self.verify)
 
     @validate_api_v2
@@ -1257,7 +1259,7 @@ class VectraClient(object):
         :param type: type of group to search (domain/host/ip)
         """
 
-        return requests.get('{url}/groups'.format(url=self.url), headers=self.headers,
+        return self.session.get('{url}/groups'.format(url=self.url), headers=self.headers,
                             params=self._generate_group_params(kwargs), verify=self.verify)
 
     @validate_api_v2
@@ -1275,7 +1277,7 @@ class VectraClient(object):
         :param page_size: number of object to return in repsonse (int)
         :param type: type of group to search (domain/host/ip)
         """
-        resp = requests.get('{url}/groups'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/groups'.format(url=self.url), headers=self.headers,
                             params=self._generate_group_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1289,7 +1291,7 @@ class VectraClient(object):
         Get groups by id
         :param rule_id: id of group to retrieve
         """
-        return requests.get('{url}/groups/{id}'.format(url=self.url, id=group_id), headers=self.headers, verify=False)
+        return self.session.get('{url}/groups/{id}'.format(url=self.url, id=group_id), headers=self.headers, verify=False)
 
     @validate_api_v2
     def get_groups_by_name(self, name=None, description=None):
@@ -1344,7 +1346,7 @@ class VectraClient(object):
                 raise TypeError("{} must be of type: list".format(k))
             payload[k] = v
 
-        return requests.post('{url}/groups'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/groups'.format(url=self.url), headers=self.headers, json=payload,
                              verify=self.verify)
 
     @validate_api_v2
@@ -1389,7 +1391,7 @@ class VectraClient(object):
 
         group['members'] = list(set(group['members']))
 
-        return requests.patch('{url}/groups/{id}'.format(url=self.url, id=id), headers=self.headers, json=group,
+        return self.session.patch('{url}/groups/{id}'.format(url=self.url, id=id), headers=self.headers, json=group,
                             verify=self.verify)
 
     @validate_api_v2
@@ -1400,7 +1402,7 @@ class VectraClient(object):
         :param group_id:
         detections
         """
-        return requests.delete('{url}/groups/{id}'.format(url=self.url, id=group_id), headers=self.headers, verify=self.verify)
+        return self.session.delete('{url}/groups/{id}'.format(url=self.url, id=group_id), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     def get_all_users(self, **kwargs):
@@ -1412,7 +1414,7 @@ class VectraClient(object):
         :param authentication_profile: filter by authentication profile
         :param last_login_gte: filter for users that have logged in since the given timestamp
         """
-        resp = requests.get('{url}/users'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/users'.format(url=self.url), headers=self.headers,
                                 params=self._generate_user_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1429,7 +1431,7 @@ class VectraClient(object):
         if not user_id:
             raise ValueError('User id required')
 
-        return requests.get('{url}/users/{id}'.format(url=self.url, id=user_id), headers=self.headers,
+        return self.session.get('{url}/users/{id}'.format(url=self.url, id=user_id), headers=self.headers,
                               verify=self.verify)
 
     @validate_api_v2
@@ -1455,7 +1457,7 @@ class VectraClient(object):
             'authentication_profile': authentication_profile
         }
 
-        return requests.patch('{url}/users/{id}'.format(url=self.url, id=user_id), json=payload, headers=self.headers,
+        return self.session.patch('{url}/users/{id}'.format(url=self.url, id=user_id), json=payload, headers=self.headers,
                               verify=self.verify)
 
     @validate_api_v2
@@ -1468,7 +1470,7 @@ class VectraClient(object):
             deprecation('The "proxy_id" argument will be removed from this function, please use the get_proxy_by_id() function')
             return self.get_proxy_by_id(proxy_id=proxy_id)
         else:
-            return requests.get('{url}/proxies'.format(url=self.url), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/proxies'.format(url=self.url), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     @request_error_handler
@@ -1480,7 +1482,7 @@ class VectraClient(object):
         if not proxy_id:
             raise ValueError('Proxy id required')
 
-        return requests.get('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), headers=self.headers,
+        return self.session.get('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), headers=self.headers,
                                 verify=self.verify)
 
     @validate_api_v2
@@ -1498,7 +1500,7 @@ class VectraClient(object):
             }
         }
 
-        return requests.post('{url}/proxies'.format(url=self.url), json=payload, headers=self.headers, verify=self.verify)
+        return self.session.post('{url}/proxies'.format(url=self.url), json=payload, headers=self.headers, verify=self.verify)
 
     # TODO PATCH request modifies the proxy ID  and 404 is actually a 500 - APP-10753
     @validate_api_v2
@@ -1521,7 +1523,7 @@ class VectraClient(object):
         if enable is not None:
             payload["proxy"]["considerProxy"] = enable
 
-        return requests.patch('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), json=payload, headers=self.headers,
+        return self.session.patch('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), json=payload, headers=self.headers,
                               verify=self.verify)
 
     @validate_api_v2
@@ -1531,7 +1533,7 @@ class VectraClient(object):
         Delete a proxy from the proxy list
         :param proxy_id: ID of the proxy to delete
         """
-        return requests.delete('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), headers=self.headers,
+        return self.session.delete('{url}/proxies/{id}'.format(url=self.url, id=proxy_id), headers=self.headers,
                               verify=self.verify)
 
     @validate_api_v2
@@ -1568,7 +1570,7 @@ class VectraClient(object):
             }
         }
 
-        return requests.post('{url}/threatFeeds'.format(url=self.url), json=payload, headers=self.headers,
+        return self.session.post('{url}/threatFeeds'.format(url=self.url), json=payload, headers=self.headers,
                              verify=self.verify)
 
     @validate_api_v2
@@ -1578,7 +1580,7 @@ class VectraClient(object):
         Deletes threat feed from Vectra
         :param feed_id: id of threat feed (returned by get_feed_by_name())
         """
-        return requests.delete('{url}/threatFeeds/{id}'.format(url=self.url, id=feed_id),
+        return self.session.delete('{url}/threatFeeds/{id}'.format(url=self.url, id=feed_id),
                                headers=self.headers, verify=self.verify)
 
     @validate_api_v2
@@ -1587,7 +1589,7 @@ class VectraClient(object):
         """
         Gets list of currently configured threat feeds
         """
-        return requests.get('{url}/threatFeeds'.format(url=self.url), headers=self.headers, verify=self.verify)
+        return self.session.get('{url}/threatFeeds'.format(url=self.url), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     def get_feed_by_name(self, name=None):
@@ -1596,7 +1598,7 @@ class VectraClient(object):
         :param name: name of threat feed
         """
         try:
-            response = requests.get('{url}/threatFeeds'.format(url=self.url), headers=self.headers, verify=self.verify)
+            response = self.session.get('{url}/threatFeeds'.format(url=self.url), headers=self.headers, verify=self.verify)
         except requests.ConnectionError:
             raise Exception('Unable to connect to remote host')
 
@@ -1617,7 +1619,7 @@ class VectraClient(object):
         """
         headers = copy.deepcopy(self.headers)
         headers.pop('Content-Type', None)
-        return requests.post('{url}/threatFeeds/{id}'.format(url=self.url, id=feed_id), headers=headers,
+        return self.session.post('{url}/threatFeeds/{id}'.format(url=self.url, id=feed_id), headers=headers,
                              files={'file': open(stix_file)}, verify=self.verify)
 
     @validate_api_v2
@@ -1640,7 +1642,7 @@ class VectraClient(object):
             'query_string': query
         }
 
-        resp = requests.get('{url}/search/{stype}'.format(url=self.url, stype=stype), headers=self.headers,
+        resp = self.session.get('{url}/search/{stype}'.format(url=self.url, stype=stype), headers=self.headers,
                                 params=params, verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1652,7 +1654,7 @@ class VectraClient(object):
         """
         Generator to get all traffic stats
         """
-        resp = requests.get('{url}/traffic'.format(url=self.url), headers=self.headers, verify=self.verify)
+        resp = self.session.get('{url}/traffic'.format(url=self.url), headers=self.headers, verify=self.verify)
         yield resp
         while resp.json()['next']:
             resp = self._get_request(url = resp.json()['next'])
@@ -1667,7 +1669,7 @@ class VectraClient(object):
         if not sensor_luid:
             raise ValueError('Sensor LUID required')
 
-        resp = requests.get('{url}/traffic/{luid}'.format(url=self.url, luid=sensor_luid), headers=self.headers, verify=self.verify)
+        resp = self.session.get('{url}/traffic/{luid}'.format(url=self.url, luid=sensor_luid), headers=self.headers, verify=self.verify)
         yield resp
         while resp.json()['next']:
             resp = self._get_request(url = resp.json()['next'])
@@ -1681,7 +1683,7 @@ class VectraClient(object):
             possible values are: subnet, hosts, firstSeen, lastSeen
         :param search: only return subnets containing the search string
         """
-        resp = requests.get('{url}/subnets'.format(url=self.url), params=self._generate_subnet_params(kwargs),
+        resp = self.session.get('{url}/subnets'.format(url=self.url), params=self._generate_subnet_params(kwargs),
             headers=self.headers, verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1700,7 +1702,7 @@ class VectraClient(object):
         if not sensor_luid:
             raise ValueError('Sensor LUID required')
 
-        resp = requests.get('{url}/subnets/{luid}'.format(url=self.url, luid=sensor_luid), 
+        resp = self.session.get('{url}/subnets/{luid}'.format(url=self.url, luid=sensor_luid), 
             params=self._generate_subnet_params(kwargs), headers=self.headers, verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1717,7 +1719,7 @@ class VectraClient(object):
         :param include_ipv4: Include IPv4 addresses - default True
         :param include_ipv6: Include IPv6 addresses - default True
         """
-        return requests.get('{url}/ip_addresses'.format(url=self.url), params=self._generate_ip_address_params(kwargs),
+        return self.session.get('{url}/ip_addresses'.format(url=self.url), params=self._generate_ip_address_params(kwargs),
             headers=self.headers, verify=self.verify)
 
     @validate_api_v2
@@ -1726,7 +1728,7 @@ class VectraClient(object):
         """
         Get all internal networks configured on the brain
         """
-        return requests.get('{url}/settings/internal_network'.format(url=self.url),
+        return self.session.get('{url}/settings/internal_network'.format(url=self.url),
             headers=self.headers, verify=self.verify)
 
     @validate_api_v2
@@ -1759,7 +1761,7 @@ class VectraClient(object):
         else:
             raise TypeError('subnets must be of type list')
 
-        return requests.post('{url}/settings/internal_network'.format(url=self.url),
+        return self.session.post('{url}/settings/internal_network'.format(url=self.url),
             json=payload, headers=self.headers, verify=self.verify)
 
     # TODO see if check parameter has been fixed - APP-10753
@@ -1771,23 +1773,24 @@ class VectraClient(object):
             possible values are: cpu, disk, hostid, memory, network, power, sensors, system
         """
         if not check:
-            return requests.get('{url}/health'.format(url=self.url), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/health'.format(url=self.url), headers=self.headers, verify=self.verify)
         else:
             if not isinstance(check, str):
                 raise ValueError('check need to be a string')
-            return requests.get('{url}/health/{check}'.format(url=self.url, check=check), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/health/{check}'.format(url=self.url, check=check), headers=self.headers, verify=self.verify)
         
 
 class VectraClientV2_1(VectraClient):
 
-    def __init__(self, url=None, token=None, verify=False):
+    def __init__(self, url=None, token=None, verify=False, session=None):
         """
         Initialize Vectra client
         :param url: IP or hostname of Vectra brain (ex https://www.example.com) - required
         :param token: API token for authentication when using API v2*
         :param verify: Verify SSL (default: False) - optional
+        :param session: requests.Session used for all API calls (default: new session) - optional
         """
-        super().__init__(url=url, token=token, verify=verify)
+        super().__init__(url=url, token=token, verify=verify, session=session)
         # Remove potential trailing slash
         url = VectraClient._remove_trailing_slashes(url)
         # Set endpoint to APIv2.1
@@ -1878,7 +1881,7 @@ class VectraClientV2_1(VectraClient):
         :param threat: threat score (int)
         :param threat_gte: threat score greater than or equal to (int)
         """
-        resp = requests.get('{url}/accounts'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/accounts'.format(url=self.url), headers=self.headers,
                                 params=self._generate_account_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -1898,7 +1901,7 @@ class VectraClientV2_1(VectraClient):
         if not account_id:
             raise ValueError('Account id required')
 
-        return requests.get('{url}/accounts/{id}'.format(url=self.url, id=account_id), headers=self.headers,
+        return self.session.get('{url}/accounts/{id}'.format(url=self.url, id=account_id), headers=self.headers,
                                 params=self._generate_account_params(kwargs), verify=self.verify)
 
     @request_error_handler
@@ -1907,7 +1910,7 @@ class VectraClientV2_1(VectraClient):
         Get Account tags
         :param account_id: ID of the account for which to retrieve the tags
         """
-        return requests.get('{url}/tagging/account/{id}'.format(url=self.url, id=account_id), headers=self.headers,
+        return self.session.get('{url}/tagging/account/{id}'.format(url=self.url, id=account_id), headers=self.headers,
                             verify=False)
 
     @request_error_handler
@@ -1937,7 +1940,7 @@ class VectraClientV2_1(VectraClient):
             'Cache-Control': "no-cache"
         })
 
-        return requests.patch('{url}/tagging/account/{id}'.format(url=self.url, id=account_id), headers=headers,
+        return self.session.patch('{url}/tagging/account/{id}'.format(url=self.url, id=account_id), headers=headers,
                               json=payload, verify=self.verify)
 
     @request_error_handler
@@ -1953,7 +1956,7 @@ class VectraClientV2_1(VectraClient):
             'objectIds': account_ids,
             'tag': tag
         }
-        return requests.post('{url}/tagging/account'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/tagging/account'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @request_error_handler
@@ -1969,7 +1972,7 @@ class VectraClientV2_1(VectraClient):
             'objectIds': account_ids,
             'tag': tag
         }
-        return requests.delete('{url}/tagging/account'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.delete('{url}/tagging/account'.format(url=self.url), headers=self.headers, json=payload,
                             verify=False)
 
     @request_error_handler
@@ -1980,7 +1983,7 @@ class VectraClientV2_1(VectraClient):
         For consistency we return a requests.models.Response object
         As we do not want to return the complete host body, we alter the response content
         """
-        account = requests.get('{url}/accounts/{id}'.format(url=self.url, id=account_id), headers=self.headers, verify=self.verify)
+        account = self.session.get('{url}/accounts/{id}'.format(url=self.url, id=account_id), headers=self.headers, verify=self.verify)
         if account.status_code == 200:
             account_note = account.json()['note']
             # API endpoint return HTML escaped characters
@@ -1998,7 +2001,7 @@ class VectraClientV2_1(VectraClient):
         """
         Get list of account locked by Account Lockdown
         """
-        return requests.get('{url}/lockdown/account'.format(url=self.url), headers=self.headers, verify=self.verify)
+        return self.session.get('{url}/lockdown/account'.format(url=self.url), headers=self.headers, verify=self.verify)
 
     def get_rules(self, **kwargs):
         raise DeprecationWarning('This function has been deprecated in the Vectra API client v2.1. Please use get_all_rules() which supports pagination')
@@ -2022,7 +2025,7 @@ class VectraClientV2_1(VectraClient):
             'query_string': query
         }
 
-        resp = requests.get('{url}/search/{stype}'.format(url=self.url, stype=stype), headers=self.headers,
+        resp = self.session.get('{url}/search/{stype}'.format(url=self.url, stype=stype), headers=self.headers,
                                 params=params, verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -2042,7 +2045,7 @@ class VectraClientV2_1(VectraClient):
         if not rule_id:
             raise ValueError('Rule id required')
 
-        return requests.get('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers,
+        return self.session.get('{url}/rules/{id}'.format(url=self.url, id=rule_id), headers=self.headers,
                                 params=self._generate_rule_by_id_params(kwargs), verify=False)
 
     def get_rules_by_name(self, triage_category=None, description=None):
@@ -2061,7 +2064,7 @@ class VectraClientV2_1(VectraClient):
         :param page: page number to return (int)
         :param page_size: number of object to return in repsonse (int)
         """
-        resp = requests.get('{url}/rules'.format(url=self.url), headers=self.headers,
+        resp = self.session.get('{url}/rules'.format(url=self.url), headers=self.headers,
                                 params=self._generate_rule_params(kwargs), verify=self.verify)
         yield resp
         while resp.json()['next']:
@@ -2157,7 +2160,7 @@ class VectraClientV2_1(VectraClient):
             'additional_conditions': additional_conditions
             }
 
-        return requests.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
+        return self.session.post('{url}/rules'.format(url=self.url), headers=self.headers, json=payload,
                              verify=self.verify)
 
     #TODO wait on fix
@@ -2248,7 +2251,7 @@ class VectraClientV2_1(VectraClient):
             else:
                 raise ValueError('invalid parameter provided: {}'.format(str(k)))
 
-        return requests.put('{url}/rules/{id}'.format(url=self.url, id=rule['id']), headers=self.headers, json=rule,
+        return self.session.put('{url}/rules/{id}'.format(url=self.url, id=rule['id']), headers=self.headers, json=rule,
                             verify=self.verify)
 
     def get_groups(self, **kwargs):
@@ -2264,7 +2267,7 @@ class VectraClientV2_1(VectraClient):
         :param end: end month for the usage statistics - format YYYY-mm
         Default is statistics from last month
         """
-        return requests.get('{url}/usage/detect'.format(url=self.url), params=self._generate_detect_usage_params(kwargs), 
+        return self.session.get('{url}/usage/detect'.format(url=self.url), params=self._generate_detect_usage_params(kwargs), 
             headers=self.headers, verify=self.verify)
 
     @request_error_handler
@@ -2275,25 +2278,26 @@ class VectraClientV2_1(VectraClient):
         :param end_date: end date (datetime.date), GMT, defaults to date.max
         """
         if start_date is None and end_date is None:
-            return requests.get('{url}/audits'.format(url=self.url), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/audits'.format(url=self.url), headers=self.headers, verify=self.verify)
         elif start_date is None and end_date is not None:
-            return requests.get('{url}/audits?end={end}'.format(url=self.url, end=end_date.isoformat()), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/audits?end={end}'.format(url=self.url, end=end_date.isoformat()), headers=self.headers, verify=self.verify)
         elif start_date is not None and end_date is None:
-            return requests.get('{url}/audits?start={start}'.format(url=self.url, start=start_date.isoformat()), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/audits?start={start}'.format(url=self.url, start=start_date.isoformat()), headers=self.headers, verify=self.verify)
         else:
-            return requests.get('{url}/audits?start={start}&end={end}'.format(url=self.url, start=start_date.isoformat(), end=end_date.isoformat()), headers=self.headers, verify=self.verify)
+            return self.session.get('{url}/audits?start={start}&end={end}'.format(url=self.url, start=start_date.isoformat(), end=end_date.isoformat()), headers=self.headers, verify=self.verify)
 
 
 class VectraClientV2_2(VectraClientV2_1):
 
-    def __init__(self, url=None, token=None, verify=False):
+    def __init__(self, url=None, token=None, verify=False, session=None):
         """
         Initialize Vectra client
         :param url: IP or hostname of Vectra brain (ex https://www.example.com) - required
         :param token: API token for authentication when using API v2*
         :param verify: Verify SSL (default: False) - optional
+        :param session: requests.Session used for all API calls (default: new session) - optional
         """
-        super().__init__(url=url, token=token, verify=verify)
+        super().__init__(url=url, token=token, verify=verify, session=session)
         # Remove potential trailing slash
         url = VectraClient._remove_trailing_slashes(url)
         # Set endpoint to APIv2.1
@@ -2307,7 +2311,7 @@ class VectraClientV2_2(VectraClientV2_1):
         if not host_id:
             raise ValueError('Host id required')
 
-        return requests.get('{url}/hosts/{id}/notes'.format(url=self.url, id=host_id), headers=self.headers, verify=self.verify)
+        return self.session.get('{url}/hosts/{id}/notes'.format(url=self.url, id=host_id), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     @request_error_handler
@@ -2324,7 +2328,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.post('{url}/hosts/{id}/notes'.format(url=self.url, id=host_id), headers=self.headers, json=payload,
+        return self.session.post('{url}/hosts/{id}/notes'.format(url=self.url, id=host_id), headers=self.headers, json=payload,
             verify=self.verify)
 
     @validate_api_v2
@@ -2343,7 +2347,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.patch('{url}/hosts/{host_id}/notes/{note_id}'.format(url=self.url, host_id=host_id, note_id=note_id), 
+        return self.session.patch('{url}/hosts/{host_id}/notes/{note_id}'.format(url=self.url, host_id=host_id, note_id=note_id), 
             headers=self.headers, json=payload, verify=self.verify)
     
     @validate_api_v2
@@ -2355,7 +2359,7 @@ class VectraClientV2_2(VectraClientV2_1):
         :param note_id: ID of the note to delete
         """
 
-        return requests.delete('{url}/hosts/{host_id}/notes/{note_id}'.format(url=self.url, host_id=host_id, note_id=note_id), 
+        return self.session.delete('{url}/hosts/{host_id}/notes/{note_id}'.format(url=self.url, host_id=host_id, note_id=note_id), 
             headers=self.headers, verify=self.verify)
 
     def get_detection_note(self, detection_id=None):
@@ -2366,7 +2370,7 @@ class VectraClientV2_2(VectraClientV2_1):
         if not detection_id:
             raise ValueError('detection id required')
 
-        return requests.get('{url}/detections/{id}/notes'.format(url=self.url, id=detection_id), headers=self.headers, verify=self.verify)
+        return self.session.get('{url}/detections/{id}/notes'.format(url=self.url, id=detection_id), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     @request_error_handler
@@ -2383,7 +2387,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.post('{url}/detections/{id}/notes'.format(url=self.url, id=detection_id), headers=self.headers, json=payload,
+        return self.session.post('{url}/detections/{id}/notes'.format(url=self.url, id=detection_id), headers=self.headers, json=payload,
             verify=self.verify)
 
     @validate_api_v2
@@ -2402,7 +2406,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.patch('{url}/detections/{detection_id}/notes/{note_id}'.format(url=self.url, detection_id=detection_id, note_id=note_id), 
+        return self.session.patch('{url}/detections/{detection_id}/notes/{note_id}'.format(url=self.url, detection_id=detection_id, note_id=note_id), 
             headers=self.headers, json=payload, verify=self.verify)
     
     @validate_api_v2
@@ -2414,7 +2418,7 @@ class VectraClientV2_2(VectraClientV2_1):
         :param note_id: ID of the note to delete
         """
 
-        return requests.delete('{url}/detections/{detection_id}/notes/{note_id}'.format(url=self.url, detection_id=detection_id, note_id=note_id), 
+        return self.session.delete('{url}/detections/{detection_id}/notes/{note_id}'.format(url=self.url, detection_id=detection_id, note_id=note_id), 
             headers=self.headers, verify=self.verify)
 
     def get_account_note(self, account_id=None):
@@ -2425,7 +2429,7 @@ class VectraClientV2_2(VectraClientV2_1):
         if not account_id:
             raise ValueError('account id required')
 
-        return requests.get('{url}/accounts/{id}/notes'.format(url=self.url, id=account_id), headers=self.headers, verify=self.verify)
+        return self.session.get('{url}/accounts/{id}/notes'.format(url=self.url, id=account_id), headers=self.headers, verify=self.verify)
 
     @validate_api_v2
     @request_error_handler
@@ -2442,7 +2446,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.post('{url}/accounts/{id}/notes'.format(url=self.url, id=account_id), headers=self.headers, json=payload,
+        return self.session.post('{url}/accounts/{id}/notes'.format(url=self.url, id=account_id), headers=self.headers, json=payload,
             verify=self.verify)
 
     @validate_api_v2
@@ -2461,7 +2465,7 @@ class VectraClientV2_2(VectraClientV2_1):
         else:
             raise TypeError('Note must be of type str')
 
-        return requests.patch('{url}/accounts/{account_id}/notes/{note_id}'.format(url=self.url, account_id=account_id, note_id=note_id), 
+        return self.session.patch('{url}/accounts/{account_id}/notes/{note_id}'.format(url=self.url, account_id=account_id, note_id=note_id), 
             headers=self.headers, json=payload, verify=self.verify)
     
     @validate_api_v2
@@ -2473,5 +2477,5 @@ class VectraClientV2_2(VectraClientV2_1):
         :param note_id: ID of the note to delete
         """
 
-        return requests.delete('{url}/accounts/{account_id}/notes/{note_id}'.format(url=self.url, account_id=account_id, note_id=note_id), 
+        return self.session.delete('{url}/accounts/{account_id}/notes/{note_id}'.format(url=self.url, account_id=account_id, note_id=note_id), 
             headers=self.headers, verify=self.verify)